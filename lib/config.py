@@ -7,14 +7,184 @@ import logging
 import os
 import sys
 import textwrap
-from collections import OrderedDict
 from configparser import ConfigParser
+from functools import lru_cache
 from importlib import import_module
 
-from lib.utils import full_path_split
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
+# Validated config contents keyed by absolute config file path, stored as
+# (mtime_ns, size, config snapshot, defaults fingerprint)
+_PARSED_CACHE = dict()
+# Plugin (_HELPTEXT, _DEFAULTS) keyed by the defaults module's dotted import path
+_PLUGIN_DEFAULTS_CACHE = dict()
+# Translation table to convert comma delimiters to whitespace for multi-select list options
+_LIST_TRANS = str.maketrans(",", " ")
+# Reusable text wrappers for formatting help text comments in the ini files
+_WRAP_FLUSH = textwrap.TextWrapper(width=100, tabsize=4, subsequent_indent="")
+_WRAP_INDENT = textwrap.TextWrapper(width=100, tabsize=4, subsequent_indent="\t\t")
+
+
+@lru_cache(maxsize=None)
+def _module_config_path(module_name):
+    """ Obtain the default ini file location for a config module.
+
+    Parameters
+    ----------
+    module_name: str
+        The full dotted name of the module that the config class is defined in
+
+    Returns
+    -------
+    str
+        The full path to the config module's ini file within the faceswap config folder
+    """
+    dirname = os.path.dirname(sys.modules[module_name].__file__)
+    folder, fname = os.path.split(dirname)
+    return os.path.join(os.path.dirname(folder), "config", "{}.ini".format(fname))
+
+
+@lru_cache(maxsize=256)
+def _dirpath_to_import_path(rel_path):
+    """ Convert a folder path, relative to the faceswap root, to a python import path.
+
+    Parameters
+    ----------
+    rel_path: str
+        The folder path relative to the faceswap root folder
+
+    Returns
+    -------
+    str
+        The dotted import path for the folder
+    """
+    return ".".join(rel_path.split(os.sep))
+
+
+@lru_cache(maxsize=512)
+def _format_help(helptext, is_section):
+    """ Format help text as comments for the ini file. Help text is repeated between config
+    files, so results are cached.
+
+    Parameters
+    ----------
+    helptext: str
+        The help text to format
+    is_section: bool
+        ``True`` if the help text is for a section header, ``False`` if it is for an item
+
+    Returns
+    -------
+    str
+        The help text formatted as ini file comments
+    """
+    formatted = []
+    for hlp in helptext.split("\n"):
+        if hlp.startswith("\t"):
+            formatted.append(_WRAP_INDENT.fill(f"\t- {hlp[1:].strip()}"))
+        else:
+            formatted.append(_WRAP_FLUSH.fill(hlp))
+    retval = "# {}".format("\n".join(formatted).replace("\n", "\n# "))
+    return retval.upper() if is_section else "\n{}".format(retval)
+
+
+def _find_files(root, suffix):
+    """ Recursively scan a folder for files ending with the given suffix, skipping cache and
+    version control folders.
+
+    Folders are traversed top-down in the same order as :func:`os.walk`, but with
+    :func:`os.scandir` so that file types are obtained without additional stat calls.
+
+    Parameters
+    ----------
+    root: str
+        The folder to scan
+    suffix: str
+        The file name suffix to match
+
+    Yields
+    ------
+    str
+        The full path to each matching file
+    """
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        subfolders = []
+        try:
+            entries = os.scandir(folder)
+        except OSError:  # Skip unreadable or missing folders, as os.walk does
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in ("__pycache__", ".git"):
+                        subfolders.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    yield entry.path
+        stack.extend(reversed(subfolders))
+
+
+class _DefaultItem():  # pylint:disable=too-few-public-methods,too-many-instance-attributes
+    """ Holds the default value and options for a single configuration item.
+
+    Parameters
+    ----------
+    default: varies
+        The default value for the item
+    info: str
+        The raw help text for the item
+    datatype: type
+        The data type of the item. One of `str`, `bool`, `float`, `int` or `list`
+    rounding: int
+        The decimal places for floats or the step interval for ints, for GUI sliders
+    min_max: tuple
+        The minimum and maximum values for numerical items, for GUI sliders
+    choices: list
+        The valid choices for the item
+    gui_radio: bool
+        ``True`` if the GUI should display radio buttons rather than a combo box
+    fixed: bool
+        ``False`` if the item can be updated for existing models
+    group: str
+        The GUI group that the item belongs to
+    """
+    __slots__ = ("default", "info", "type", "rounding", "min_max", "choices", "gui_radio",
+                 "fixed", "group", "_helptext")
+
+    def __init__(self, default, info, datatype, rounding, min_max, choices, gui_radio, fixed,
+                 group):
+        self.default = default
+        self.info = info
+        self.type = datatype
+        self.rounding = rounding
+        self.min_max = min_max
+        self.choices = choices
+        self.gui_radio = gui_radio
+        self.fixed = fixed
+        self.group = group
+        self._helptext = None
+
+    def __repr__(self):
+        return ("{}(default={!r}, type={}, rounding={}, min_max={}, choices={}, gui_radio={}, "
+                "fixed={}, group={})".format(self.__class__.__name__, self.default, self.type,
+                                             self.rounding, self.min_max, self.choices,
+                                             self.gui_radio, self.fixed, self.group))
+
+    @property
+    def helptext(self):
+        """ str: The full help text for the item. Expanded from :attr:`info` on first access, as
+        it is only required when writing the config file or displaying the item in the GUI. """
+        if self._helptext is None:
+            self._helptext = FaceswapConfig.expand_helptext(self.info,
+                                                            self.choices,
+                                                            self.default,
+                                                            self.type,
+                                                            self.min_max,
+                                                            self.fixed)
+        return self._helptext
+
 
 class FaceswapConfig():
     """ Config Items """
@@ -23,11 +193,19 @@ class FaceswapConfig():
         logger.debug("Initializing: %s", self.__class__.__name__)
         self.configfile = self.get_config_file(configfile)
         self.config = ConfigParser(allow_no_value=True)
-        self.defaults = OrderedDict()
+        self.defaults = dict()
         self.config.optionxform = str
         self.section = section
+        self._value_cache = dict()
+        self._config_dict_cache = dict()
+        self._changeable_cache = dict()
+        self._global_sections = []
+        self._section_set = set()
+        self._defaults_keyset = frozenset()
+        self._default_keys = dict()
 
         self.set_defaults()
+        self._validators = self._get_validators()
         self.handle_config()
         logger.debug("Initialized: %s", self.__class__.__name__)
 
@@ -35,18 +213,23 @@ class FaceswapConfig():
     def changeable_items(self):
         """ Training only.
             Return a dict of config items with their set values for items
-            that can be altered after the model has been created """
+            that can be altered after the model has been created
+
+            The result is cached per section and returned as a shallow copy, so list values are
+            shared with the cache and must not be modified in place """
+        if self.section in self._changeable_cache:
+            return dict(self._changeable_cache[self.section])
         retval = dict()
-        sections = [sect for sect in self.config.sections() if sect.startswith("global")]
-        for sect in sections + [self.section]:
+        for sect in self._global_sections + [self.section]:
             if sect not in self.defaults:
                 continue
             for key, val in self.defaults[sect].items():
-                if key == "helptext" or val["fixed"]:
+                if key == "helptext" or val.fixed:
                     continue
                 retval[key] = self.get(sect, key)
         logger.debug("Alterable for existing models: %s", retval)
-        return retval
+        self._changeable_cache[self.section] = retval
+        return dict(retval)
 
     def set_defaults(self):
         """ Override for plugin specific config defaults
@@ -76,16 +259,13 @@ class FaceswapConfig():
         plugin_folder: str
             The folder to scan for plugins
         """
-        for dirpath, _, filenames in os.walk(plugin_folder):
-            default_files = [fname for fname in filenames if fname.endswith("_defaults.py")]
-            if not default_files:
-                continue
-            base_path = os.path.dirname(os.path.realpath(sys.argv[0]))
+        base_path = os.path.dirname(os.path.realpath(sys.argv[0]))
+        for filepath in _find_files(plugin_folder, "_defaults.py"):
+            dirpath, filename = os.path.split(filepath)
             # Can't use replace as there is a bug on some Windows installs that lowers some paths
-            import_path = ".".join(full_path_split(dirpath[len(base_path):])[1:])
+            import_path = _dirpath_to_import_path(os.path.relpath(dirpath, base_path))
             plugin_type = import_path.split(".")[-1]
-            for filename in default_files:
-                self._load_defaults_from_module(filename, import_path, plugin_type)
+            self._load_defaults_from_module(filename, import_path, plugin_type)
 
     def _load_defaults_from_module(self, filename, module_path, plugin_type):
         """ Load the plugin's defaults module, extract defaults and add to default configuration.
@@ -99,32 +279,57 @@ class FaceswapConfig():
         plugin_type: str
             The type of plugin that the defaults are being loaded for
         """
-        logger.debug("Adding defaults: (filename: %s, module_path: %s, plugin_type: %s",
-                     filename, module_path, plugin_type)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Adding defaults: (filename: %s, module_path: %s, plugin_type: %s",
+                         filename, module_path, plugin_type)
         module = os.path.splitext(filename)[0]
         section = ".".join((plugin_type, module.replace("_defaults", "")))
-        logger.debug("Importing defaults module: %s.%s", module_path, module)
-        mod = import_module("{}.{}".format(module_path, module))
-        self.add_section(title=section, info=mod._HELPTEXT)  # pylint:disable=protected-access
-        for key, val in mod._DEFAULTS.items():  # pylint:disable=protected-access
+        mod_name = "{}.{}".format(module_path, module)
+        if mod_name not in _PLUGIN_DEFAULTS_CACHE:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Importing defaults module: %s", mod_name)
+            mod = import_module(mod_name)
+            _PLUGIN_DEFAULTS_CACHE[mod_name] = (mod._HELPTEXT,  # pylint:disable=protected-access
+                                                mod._DEFAULTS)  # pylint:disable=protected-access
+        helptext, defaults = _PLUGIN_DEFAULTS_CACHE[mod_name]
+        self.add_section(title=section, info=helptext)
+        for key, val in defaults.items():
             self.add_item(section=section, title=key, **val)
-        logger.debug("Added defaults: %s", section)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Added defaults: %s", section)
 
     @property
     def config_dict(self):
         """ Collate global options and requested section into a dictionary with the correct
-        data types """
+        data types.
+
+        The result is cached per section and returned as a shallow copy, so list values are shared
+        with the cache and must not be modified in place. """
+        if self.section in self._config_dict_cache:
+            return dict(self._config_dict_cache[self.section])
         conf = dict()
-        sections = [sect for sect in self.config.sections() if sect.startswith("global")]
-        sections.append(self.section)
-        for sect in sections:
-            if sect not in self.config.sections():
+        for sect in self._global_sections + [self.section]:
+            if sect not in self._section_set:
                 continue
             for key in self.config[sect]:
                 if key.startswith(("#", "\n")):  # Skip comments
                     continue
                 conf[key] = self.get(sect, key)
-        return conf
+        self._config_dict_cache[self.section] = conf
+        return dict(conf)
+
+    def invalidate(self):
+        """ Clear all cached configuration values and re-index the sections held in
+        :attr:`config`. Must be called whenever :attr:`config` is altered outside of this class's
+        own setters, for example when values are written directly to the ConfigParser, as is done
+        by the preview tool. """
+        logger.debug("Invalidating cached config values")
+        self._value_cache.clear()
+        self._config_dict_cache.clear()
+        self._changeable_cache.clear()
+        sections = self.config.sections()
+        self._global_sections = [sect for sect in sections if sect.startswith("global")]
+        self._section_set = set(sections)
 
     def get(self, section, option):
         """ Return a config item in it's correct format.
@@ -141,8 +346,15 @@ class FaceswapConfig():
         varies
             The selected configuration option in the correct data format
         """
-        logger.debug("Getting config item: (section: '%s', option: '%s')", section, option)
-        datatype = self.defaults[section][option]["type"]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Getting config item: (section: '%s', option: '%s')", section, option)
+        key = (section, option)
+        if key in self._value_cache:
+            retval = self._value_cache[key]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Returning cached item: (value: %s)", retval)
+            return retval
+        datatype = self.defaults[section][option].type
         if datatype == bool:
             func = self.config.getboolean
         elif datatype == int:
@@ -154,11 +366,35 @@ class FaceswapConfig():
         else:
             func = self.config.get
         retval = func(section, option)
-        if isinstance(retval, str) and retval.lower() == "none":
+        # Value-less keys return None. Check length first to avoid a lower case copy
+        if (datatype == str and retval is not None
+                and len(retval) == 4 and retval.lower() == "none"):
             retval = None
-        logger.debug("Returning item: (type: %s, value: %s)", datatype, retval)
+        self._value_cache[key] = retval
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Returning item: (type: %s, value: %s)", datatype, retval)
         return retval
 
+    def _set(self, section, option, value, config=None):
+        """ Set a value in the given config and invalidate any cached parsed value for it.
+
+        Parameters
+        ----------
+        section: str
+            The configuration section to set the value for
+        option: str
+            The configuration option to set the value for
+        value: str
+            The value to set
+        config: :class:`configparser.ConfigParser`, optional
+            The config to set the value in. ``None`` to use :attr:`config`. Default: ``None``
+        """
+        config = self.config if config is None else config
+        config.set(section, option, value)
+        self._value_cache.pop((section, option), None)
+        self._config_dict_cache.clear()
+        self._changeable_cache.clear()
+
     def _parse_list(self, section, option):
         """ Parse options that are stored as lists in the config file. These can be space or
         comma-separated items in the config file. They will be returned as a list of strings,
@@ -179,12 +415,13 @@ class FaceswapConfig():
         """
         raw_option = self.config.get(section, option)
         if not raw_option:
-            logger.debug("No options selected, returning empty list")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("No options selected, returning empty list")
             return []
-        delimiter = "," if "," in raw_option else None
-        retval = [opt.strip().lower() for opt in raw_option.split(delimiter)]
-        logger.debug("Processed raw option '%s' to list %s for section '%s', option '%s'",
-                     raw_option, retval, section, option)
+        retval = raw_option.translate(_LIST_TRANS).lower().split()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processed raw option '%s' to list %s for section '%s', option '%s'",
+                         raw_option, retval, section, option)
         return retval
 
     def get_config_file(self, configfile):
@@ -195,9 +432,7 @@ class FaceswapConfig():
                 logger.error(err)
                 raise ValueError(err)
             return configfile
-        dirname = os.path.dirname(sys.modules[self.__module__].__file__)
-        folder, fname = os.path.split(dirname)
-        retval = os.path.join(os.path.dirname(folder), "config", "{}.ini".format(fname))
+        retval = _module_config_path(self.__module__)
         logger.debug("Config File location: '%s'", retval)
         return retval
 
@@ -207,8 +442,10 @@ class FaceswapConfig():
         if None in (title, info):
             raise ValueError("Default config sections must have a title and "
                              "information text")
-        self.defaults[title] = OrderedDict()
+        self.defaults[title] = dict()
         self.defaults[title]["helptext"] = info
+        self._defaults_keyset = frozenset(self.defaults)
+        self._default_keys[title] = set()
 
     def add_item(self, section=None, title=None, datatype=str, default=None, info=None,
                  rounding=None, min_max=None, choices=None, gui_radio=False, fixed=True,
@@ -238,10 +475,11 @@ class FaceswapConfig():
             The 'Group' parameter allows you to assign the config item to a group in the GUI
 
         """
-        logger.debug("Add item: (section: '%s', title: '%s', datatype: '%s', default: '%s', "
-                     "info: '%s', rounding: '%s', min_max: %s, choices: %s, gui_radio: %s, "
-                     "fixed: %s, group: %s)", section, title, datatype, default, info, rounding,
-                     min_max, choices, gui_radio, fixed, group)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Add item: (section: '%s', title: '%s', datatype: '%s', "
+                         "default: '%s', info: '%s', rounding: '%s', min_max: %s, choices: %s, "
+                         "gui_radio: %s, fixed: %s, group: %s)", section, title, datatype,
+                         default, info, rounding, min_max, choices, gui_radio, fixed, group)
 
         choices = list() if not choices else choices
 
@@ -260,16 +498,33 @@ class FaceswapConfig():
         if not isinstance(choices, (list, tuple)):
             raise ValueError("'choices' must be a list or tuple")
 
-        info = self.expand_helptext(info, choices, default, datatype, min_max, fixed)
-        self.defaults[section][title] = {"default": default,
-                                         "helptext": info,
-                                         "type": datatype,
-                                         "rounding": rounding,
-                                         "min_max": min_max,
-                                         "choices": choices,
-                                         "gui_radio": gui_radio,
-                                         "fixed": fixed,
-                                         "group": group}
+        self.defaults[section][title] = _DefaultItem(default,
+                                                     info,
+                                                     datatype,
+                                                     rounding,
+                                                     min_max,
+                                                     choices,
+                                                     gui_radio,
+                                                     fixed,
+                                                     group)
+        self._default_keys[section].add(title)
+
+    def helptext(self, section, item):
+        """ Obtain the full help text for a default config item.
+
+        Parameters
+        ----------
+        section: str
+            The configuration section that the item belongs to
+        item: str
+            The configuration item to obtain the help text for
+
+        Returns
+        -------
+        str
+            The expanded help text for the config item
+        """
+        return self.defaults[section][item].helptext
 
     @staticmethod
     def expand_helptext(helptext, choices, default, datatype, min_max, fixed):
@@ -304,18 +559,46 @@ class FaceswapConfig():
     def create_default(self):
         """ Generate a default config if it does not exist """
         logger.debug("Creating default Config")
+        self.config.optionxform = str
+        self.config.read_dict(self._get_config_batch())
+        self.save_config()
+
+    def _get_config_batch(self, existing=None):
+        """ Collate the default configuration into a dictionary that can be ingested in a single
+        pass by :func:`configparser.ConfigParser.read_dict`.
+
+        Help text is stored as value-less keys, so it is batched as a dictionary rather than as
+        ini formatted text, which would be stripped as comments when parsed.
+
+        Parameters
+        ----------
+        existing: :class:`configparser.ConfigParser`, optional
+            An existing config to retain the option values from. ``None`` to use the default
+            values for all options. Default: ``None``
+
+        Returns
+        -------
+        dict
+            Dictionary of section names to dictionaries of option name and value pairs
+        """
+        batch = dict()
         for section, items in self.defaults.items():
-            logger.debug("Adding section: '%s')", section)
-            self.insert_config_section(section, items["helptext"])
+            current = None
+            if existing is not None and existing.has_section(section):
+                current = existing[section]
+            elif existing is not None:
+                logger.debug("Adding new config section: '%s'", section)
+            batch[section] = {self.format_help(items["helptext"], is_section=True): None}
             for item, opt in items.items():
-                logger.debug("Adding option: (item: '%s', opt: '%s')", item, opt)
                 if item == "helptext":
                     continue
-                self.insert_config_item(section,
-                                        item,
-                                        opt["default"],
-                                        opt)
-        self.save_config()
+                if current is None:
+                    opt_value = opt.default
+                else:
+                    opt_value = current.get(item, opt.default)
+                batch[section][self.format_help(self.helptext(section, item))] = None
+                batch[section][item] = str(opt_value)
+        return batch
 
     def insert_config_section(self, section, helptext, config=None):
         """ Insert a section into the config """
@@ -331,46 +614,41 @@ class FaceswapConfig():
     def insert_config_item(self, section, item, default, option,
                            config=None):
         """ Insert an item into a config section """
-        logger.debug("Inserting item: (section: '%s', item: '%s', default: '%s', helptext: '%s', "
-                     "config: '%s')", section, item, default, option["helptext"], config)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Inserting item: (section: '%s', item: '%s', default: '%s', "
+                         "helptext: '%s', config: '%s')",
+                         section, item, default, option.info, config)
         config = self.config if config is None else config
         config.optionxform = str
-        helptext = option["helptext"]
-        helptext = self.format_help(helptext, is_section=False)
+        helptext = self.format_help(self.helptext(section, item), is_section=False)
         config.set(section, helptext)
-        config.set(section, item, str(default))
-        logger.debug("Inserted item: '%s'", item)
+        self._set(section, item, str(default), config=config)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Inserted item: '%s'", item)
 
     @staticmethod
     def format_help(helptext, is_section=False):
         """ Format comments for default ini file """
-        logger.debug("Formatting help: (helptext: '%s', is_section: '%s')", helptext, is_section)
-        formatted = ""
-        for hlp in helptext.split("\n"):
-            subsequent_indent = "\t\t" if hlp.startswith("\t") else ""
-            hlp = f"\t- {hlp[1:].strip()}" if hlp.startswith("\t") else hlp
-            formatted += textwrap.fill(hlp,
-                                       100,
-                                       tabsize=4,
-                                       subsequent_indent=subsequent_indent) + "\n"
-        helptext = '# {}'.format(formatted[:-1].replace("\n", "\n# "))  # Strip last newline
-        if is_section:
-            helptext = helptext.upper()
-        else:
-            helptext = "\n{}".format(helptext)
-        logger.debug("formatted help: '%s'", helptext)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Formatting help: (helptext: '%s', is_section: '%s')",
+                         helptext, is_section)
+        helptext = _format_help(helptext, is_section)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("formatted help: '%s'", helptext)
         return helptext
 
     def load_config(self):
         """ Load values from config """
         logger.verbose("Loading config: '%s'", self.configfile)
         self.config.read(self.configfile)
+        self.invalidate()
 
     def save_config(self):
         """ Save a config file """
         logger.info("Updating config at: '%s'", self.configfile)
         with open(self.configfile, "w") as f_cfgfile:
             self.config.write(f_cfgfile)
+        self.invalidate()
         logger.debug("Updated config at: '%s'", self.configfile)
 
     def validate_config(self):
@@ -380,73 +658,75 @@ class FaceswapConfig():
         if self.check_config_change():
             self.add_new_config_items()
         self.check_config_choices()
+        self.invalidate()
         logger.debug("Validated config")
 
     def add_new_config_items(self):
         """ Add new items to the config file """
         logger.debug("Updating config")
         new_config = ConfigParser(allow_no_value=True)
-        for section, items in self.defaults.items():
-            self.insert_config_section(section, items["helptext"], new_config)
-            for item, opt in items.items():
-                if item == "helptext":
-                    continue
-                if section not in self.config.sections():
-                    logger.debug("Adding new config section: '%s'", section)
-                    opt_value = opt["default"]
-                else:
-                    opt_value = self.config[section].get(item, opt["default"])
-                self.insert_config_item(section,
-                                        item,
-                                        opt_value,
-                                        opt,
-                                        new_config)
+        new_config.optionxform = str
+        new_config.read_dict(self._get_config_batch(existing=self.config))
         self.config = new_config
-        self.config.optionxform = str
+        self.invalidate()
         self.save_config()
         logger.debug("Updated config")
 
+    def _get_validators(self):
+        """ Obtain the default items that have choices which need to be validated.
+
+        Returns
+        -------
+        list
+            List of (`section`, `item`, `datatype`, `choices`, `lower case choices`) tuples for
+            each default configuration item that has choices
+        """
+        retval = [(section, item, opt.type, opt.choices,
+                   tuple(choice.lower() for choice in opt.choices))
+                  for section, items in self.defaults.items()
+                  for item, opt in items.items()
+                  if item != "helptext" and opt.choices]
+        logger.debug("Config items with choices: %s", len(retval))
+        return retval
+
     def check_config_choices(self):
         """ Check that config items are valid choices """
         logger.debug("Checking config choices")
-        for section, items in self.defaults.items():
-            for item, opt in items.items():
-                if item == "helptext" or not opt["choices"]:
+        for section, item, datatype, choices, choices_lower in self._validators:
+            if datatype == list:  # Multi-select items
+                opt_value = self._parse_list(section, item)
+                if not opt_value:  # No option selected
+                    continue
+                if not all(val in choices for val in opt_value):
+                    invalid = [val for val in opt_value if val not in choices]
+                    valid = ", ".join(val for val in opt_value if val in choices)
+                    logger.warning("The option(s) %s are not valid selections for '%s': '%s'. "
+                                   "setting to: '%s'", invalid, section, item, valid)
+                    self._set(section, item, valid)
+            else:  # Single-select items
+                opt_value = self.config.get(section, item)
+                if opt_value.lower() == "none" and "none" in choices_lower:
                     continue
-                if opt["type"] == list:  # Multi-select items
-                    opt_value = self._parse_list(section, item)
-                    if not opt_value:  # No option selected
-                        continue
-                    if not all(val in opt["choices"] for val in opt_value):
-                        invalid = [val for val in opt_value if val not in opt["choices"]]
-                        valid = ", ".join(val for val in opt_value if val in opt["choices"])
-                        logger.warning("The option(s) %s are not valid selections for '%s': '%s'. "
-                                       "setting to: '%s'", invalid, section, item, valid)
-                        self.config.set(section, item, valid)
-                else:  # Single-select items
-                    opt_value = self.config.get(section, item)
-                    if opt_value.lower() == "none" and any(choice.lower() == "none"
-                                                           for choice in opt["choices"]):
-                        continue
-                    if opt_value not in opt["choices"]:
-                        default = str(opt["default"])
-                        logger.warning("'%s' is not a valid config choice for '%s': '%s'. "
-                                       "Defaulting to: '%s'", opt_value, section, item, default)
-                        self.config.set(section, item, default)
+                if opt_value not in choices:
+                    default = str(self.defaults[section][item].default)
+                    logger.warning("'%s' is not a valid config choice for '%s': '%s'. "
+                                   "Defaulting to: '%s'", opt_value, section, item, default)
+                    self._set(section, item, default)
         logger.debug("Checked config choices")
 
     def check_config_change(self):
         """ Check whether new default items have been added or removed
             from the config file compared to saved version """
-        if set(self.config.sections()) != set(self.defaults.keys()):
+        sections = self.config.sections()
+        if (len(sections) != len(self._defaults_keyset)
+                or not all(sect in self._defaults_keyset for sect in sections)):
             logger.debug("Default config has new section(s)")
             return True
 
-        for section, items in self.defaults.items():
-            opts = [opt for opt in items.keys() if opt != "helptext"]
-            exists = [opt for opt in self.config[section].keys()
-                      if not opt.startswith(("# ", "\n# "))]
-            if set(exists) != set(opts):
+        for section, opts in self._default_keys.items():
+            exists = frozenset(opt for opt in self.config[section]
+                               if not opt.startswith(("# ", "\n# ")))
+            if exists != opts:
                 logger.debug("Default config has new item(s)")
                 return True
         logger.debug("Default config has not changed")
@@ -463,10 +743,61 @@ class FaceswapConfig():
                      self.section, self.configfile)
         if not self.check_exists():
             self.create_default()
+        if self._load_from_cache():
+            logger.debug("Handled config from cache")
+            return
         self.load_config()
         self.validate_config()
+        self._update_cache()
         logger.debug("Handled config")
 
+    def _defaults_fingerprint(self):
+        """ Obtain a fingerprint of the section and item names held in :attr:`defaults`.
+
+        Returns
+        -------
+        tuple
+            Tuple of (`section`, `item names`) for each section in the default configuration
+        """
+        return tuple((section, tuple(items)) for section, items in self.defaults.items())
+
+    def _load_from_cache(self):
+        """ Populate :attr:`config` from the module level cache if the config file and the
+        default configuration have not changed since they were last validated.
+
+        Returns
+        -------
+        bool
+            ``True`` if the config was loaded from the cache otherwise ``False``
+        """
+        cached = _PARSED_CACHE.get(os.path.abspath(self.configfile))
+        if cached is None:
+            return False
+        stat = os.stat(self.configfile)
+        mtime, size, snapshot, fingerprint = cached
+        if (mtime, size) != (stat.st_mtime_ns, stat.st_size):
+            logger.debug("Config file has changed since it was cached: '%s'", self.configfile)
+            return False
+        if fingerprint != self._defaults_fingerprint():
+            logger.debug("Default config has changed since it was cached")
+            return False
+        logger.verbose("Loading config from cache: '%s'", self.configfile)
+        self.config.read_dict(snapshot)
+        self.invalidate()
+        return True
+
+    def _update_cache(self):
+        """ Store the validated contents of :attr:`config` in the module level cache, keyed by
+        the config file's path and fingerprinted by its modification time and size. """
+        stat = os.stat(self.configfile)
+        snapshot = {section: dict(self.config.items(section, raw=True))
+                    for section in self.config.sections()}
+        _PARSED_CACHE[os.path.abspath(self.configfile)] = (stat.st_mtime_ns,
+                                                           stat.st_size,
+                                                           snapshot,
+                                                           self._defaults_fingerprint())
+        logger.debug("Cached config: '%s'", self.configfile)
+
 
 def generate_configs():
     """ Generate config files if they don't exist.
@@ -478,8 +809,9 @@ def generate_configs():
     base_path = os.path.realpath(os.path.dirname(sys.argv[0]))
     plugins_path = os.path.join(base_path, "plugins")
     configs_path = os.path.join(base_path, "config")
-    for dirpath, _, filenames in os.walk(plugins_path):
-        if "_config.py" in filenames:
+    for filepath in _find_files(plugins_path, "_config.py"):
+        dirpath, filename = os.path.split(filepath)
+        if filename == "_config.py":
             section = os.path.split(dirpath)[-1]
             config_file = os.path.join(configs_path, "{}.ini".format(section))
             if not os.path.exists(config_file):
@@ -452,22 +452,22 @@ class DisplayArea(ttk.Frame):  # pylint:disable=too-many-ancestors
                         continue
                     initial_value = conf.config_dict[option]
                     initial_value = "none" if initial_value is None else initial_value
-                    if params["type"] == list and isinstance(initial_value, list):
+                    if params.type == list and isinstance(initial_value, list):
                         # Split multi-select lists into space separated strings for tk variables
                         initial_value = " ".join(initial_value)
 
                     retval[key]["options"][option] = ControlPanelOption(
                         title=option,
-                        dtype=params["type"],
-                        group=params["group"],
-                        default=params["default"],
+                        dtype=params.type,
+                        group=params.group,
+                        default=params.default,
                         initial_value=initial_value,
-                        choices=params["choices"],
-                        is_radio=params["gui_radio"],
-                        is_multi_option=params["type"] == list,
-                        rounding=params["rounding"],
-                        min_max=params["min_max"],
-                        helptext=params["helptext"])
+                        choices=params.choices,
+                        is_radio=params.gui_radio,
+                        is_multi_option=params.type == list,
+                        rounding=params.rounding,
+                        min_max=params.min_max,
+                        helptext=conf.helptext(section, option))
         logger.debug("Formatted Config for GUI: %s", retval)
         return retval
 
@@ -677,9 +677,9 @@ class DisplayArea(ttk.Frame):  # pylint:disable=too-many-ancestors
                     new_opt = self._config_cpanel_dict[key]["options"][item].get()
                     logger.debug("Updating value to '%s' for %s",
                                  new_opt, ".".join([section, item]))
-                helptext = config.format_help(options["helptext"], is_section=False)
+                helptext = config.format_help(config.helptext(section, item), is_section=False)
                 new_config.set(section, helptext)
-                if options["type"] == list:  # Comma separated multi select options
+                if options.type == list:  # Comma separated multi select options
                     new_opt = ", ".join(new_opt if isinstance(new_opt, list) else new_opt.split())
                 new_config.set(section, item, str(new_opt))
         config.config = new_config
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+""" Tests for Faceswap Config. """
+
+import pytest
+
+import lib.logger  # noqa pylint:disable=unused-import # Adds the custom log levels
+from lib.config import FaceswapConfig, _find_files
+
+
+class _Config(FaceswapConfig):
+    """ Minimal configuration for testing """
+    def set_defaults(self):
+        """ Set the default values for config """
+        self.add_section(title="global", info="Global options")
+        self.add_item(section="global", title="allow_growth", datatype=bool, default=False,
+                      info="Global option", fixed=False)
+        self.add_section(title="test.plugin", info="Plugin options")
+        self.add_item(section="test.plugin", title="threshold", datatype=float, default=99.0,
+                      rounding=1, min_max=(0.0, 100.0), info="Float option", fixed=False)
+        self.add_item(section="test.plugin", title="method", datatype=str, default="box",
+                      choices=["none", "box", "gaussian"], info="Choice option")
+
+
+class _ConfigExtra(_Config):
+    """ Test configuration with an additional default item """
+    def set_defaults(self):
+        """ Set the default values for config """
+        super().set_defaults()
+        self.add_item(section="test.plugin", title="extra", datatype=int, default=5,
+                      rounding=1, min_max=(0, 10), info="Additional option")
+
+
+def _no_load(*args, **kwargs):
+    """ Replacement for :func:`FaceswapConfig.load_config` that fails if the file is read """
+    raise AssertionError("Config file should not have been read")
+
+
+@pytest.fixture(name="config")
+def fixture_config(tmp_path):
+    """ A freshly generated configuration for the test plugin """
+    configfile = tmp_path / "test.ini"
+    configfile.touch()
+    return _Config("test.plugin", configfile=str(configfile))
+
+
+def test_get_after_set(config):
+    """ Values set through the config's setter are returned by :func:`get`. """
+    assert config.get("test.plugin", "threshold") == 99.0
+    config._set("test.plugin", "threshold", "77.0")  # pylint:disable=protected-access
+    assert config.get("test.plugin", "threshold") == 77.0
+
+
+def test_get_after_direct_write(config):
+    """ Direct writes to the ConfigParser are returned by :func:`get` and
+    :attr:`config_dict` after :func:`invalidate` is called. """
+    assert config.config_dict == {"allow_growth": False, "threshold": 99.0, "method": "box"}
+    config.config["test.plugin"]["threshold"] = "77.0"
+    config.invalidate()
+    assert config.get("test.plugin", "threshold") == 77.0
+    assert config.config_dict["threshold"] == 77.0
+
+
+def test_get_after_load(config):
+    """ Values saved to the config file are returned after the config is reloaded. """
+    assert config.get("test.plugin", "method") == "box"
+    config.config["test.plugin"]["method"] = "gaussian"
+    config.save_config()
+    config.load_config()
+    assert config.get("test.plugin", "method") == "gaussian"
+
+
+def test_config_dict_per_section(config):
+    """ :attr:`config_dict` is cached per section, so changing the section returns the
+    requested section's values. """
+    assert "threshold" in config.config_dict
+    config.section = "global"
+    assert config.config_dict == {"allow_growth": False}
+    config.section = "test.plugin"
+    assert "threshold" in config.config_dict
+
+
+def test_config_dict_copy(config):
+    """ Altering a returned :attr:`config_dict` does not alter the cached values. """
+    conf = config.config_dict
+    conf["threshold"] = 0.0
+    assert config.config_dict["threshold"] == 99.0
+
+
+def test_cached_dicts_after_set(config):
+    """ :attr:`config_dict` and :attr:`changeable_items` reflect values set through the
+    config's setter. """
+    assert config.changeable_items == {"allow_growth": False, "threshold": 99.0}
+    config._set("test.plugin", "threshold", "77.0")  # pylint:disable=protected-access
+    assert config.config_dict["threshold"] == 77.0
+    assert config.changeable_items["threshold"] == 77.0
+
+
+def test_cached_dicts_after_invalidate(config):
+    """ :attr:`changeable_items` reflects direct ConfigParser writes after :func:`invalidate`
+    is called. """
+    assert config.changeable_items["allow_growth"] is False
+    config.config["global"]["allow_growth"] = "True"
+    config.invalidate()
+    assert config.changeable_items["allow_growth"] is True
+
+
+def test_find_files(tmp_path):
+    """ :func:`lib.config._find_files` finds matching files, skips cache folders and does not
+    raise on missing folders. """
+    (tmp_path / "plugin").mkdir()
+    (tmp_path / "plugin" / "test_defaults.py").touch()
+    (tmp_path / "plugin" / "test.py").touch()
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "cached_defaults.py").touch()
+    found = list(_find_files(str(tmp_path), "_defaults.py"))
+    assert found == [str(tmp_path / "plugin" / "test_defaults.py")]
+    assert not list(_find_files(str(tmp_path / "missing"), "_defaults.py"))
+
+
+@pytest.mark.parametrize("value", ["none", "None", "NONE"])
+def test_get_none_literal(config, value):
+    """ The literal "none" in any case is returned as ``None`` for str options. """
+    config._set("test.plugin", "method", value)  # pylint:disable=protected-access
+    assert config.get("test.plugin", "method") is None
+
+
+def test_get_valueless_str(config):
+    """ A str option with no value is returned as ``None``. """
+    config._set("test.plugin", "method", None)  # pylint:disable=protected-access
+    assert config.get("test.plugin", "method") is None
+
+
+def test_cache_hit(config, monkeypatch):
+    """ An unchanged config file is loaded from the validated cache without being re-read,
+    returning the choice corrected values. """
+    with open(config.configfile, "r") as cfg:
+        content = cfg.read()
+    assert "method = box" in content
+    with open(config.configfile, "w") as cfg:
+        cfg.write(content.replace("method = box", "method = bogus"))
+    validated = _Config("test.plugin", configfile=config.configfile)
+    assert validated.get("test.plugin", "method") == "box"
+
+    monkeypatch.setattr(_Config, "load_config", _no_load)
+    cached = _Config("test.plugin", configfile=config.configfile)
+    assert cached.get("test.plugin", "method") == "box"
+    assert cached.config_dict == validated.config_dict
+
+
+def test_cache_miss_file_changed(config):
+    """ A rewritten config file is re-read rather than loaded from the cache. """
+    with open(config.configfile, "r") as cfg:
+        content = cfg.read()
+    assert "threshold = 99.0" in content
+    with open(config.configfile, "w") as cfg:
+        cfg.write(content.replace("threshold = 99.0", "threshold = 7.5"))
+    reloaded = _Config("test.plugin", configfile=config.configfile)
+    assert reloaded.get("test.plugin", "threshold") == 7.5
+
+
+def test_cache_miss_defaults_changed(config, monkeypatch):
+    """ A change to the default items is validated rather than loaded from the cache. """
+    called = []
+    load_config = _Config.load_config
+
+    def _load(self):
+        called.append(True)
+        load_config(self)
+
+    monkeypatch.setattr(_Config, "load_config", _load)
+    extra = _ConfigExtra("test.plugin", configfile=config.configfile)
+    assert called
+    assert extra.get("test.plugin", "extra") == 5
+    with open(config.configfile, "r") as cfg:
+        assert "extra = 5" in cfg.read()
+
+
+@pytest.mark.parametrize(["raw", "expected"],
+                         [("a, b, c", ["a", "b", "c"]),
+                          ("a b c", ["a", "b", "c"]),
+                          ("A b, c", ["a", "b", "c"]),
+                          ("a,,b", ["a", "b"]),
+                          ("", [])],
+                         ids=["comma", "space", "mixed", "empty_item", "empty"])
+def test_parse_list(config, raw, expected):
+    """ List options split on commas and whitespace, are lower cased and drop empty items. """
+    config.config.set("test.plugin", "threshold", raw)
+    assert config._parse_list("test.plugin", "threshold") == expected  # pylint:disable=W0212
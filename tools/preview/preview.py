@@ -839,6 +839,7 @@ class ConfigTools():
 
     def update_config(self):
         """ Update :attr:`config` with the currently selected values from the GUI. """
+        updated = False
         for section, items in self.tk_vars.items():
             for item, value in items.items():
                 try:
@@ -853,6 +854,10 @@ class ConfigTools():
                     logger.trace("Updating config: %s, %s from %s to %s",
                                  section, item, old_value, new_value)
                     self._config.config[section][item] = new_value
+                    updated = True
+        if updated:
+            # Values are written directly to the ConfigParser, so clear the cached values
+            self._config.invalidate()
 
     def _get_config_dicts(self):
         """ Obtain a custom configuration dictionary for convert configuration items in use
@@ -873,15 +878,15 @@ class ConfigTools():
                     config_dicts.setdefault(section, dict())[key] = val
                     continue
                 cp_option = ControlPanelOption(title=key,
-                                               dtype=val["type"],
-                                               group=val["group"],
-                                               default=val["default"],
+                                               dtype=val.type,
+                                               group=val.group,
+                                               default=val.default,
                                                initial_value=self._config.get(section, key),
-                                               choices=val["choices"],
-                                               is_radio=val["gui_radio"],
-                                               rounding=val["rounding"],
-                                               min_max=val["min_max"],
-                                               helptext=val["helptext"])
+                                               choices=val.choices,
+                                               is_radio=val.gui_radio,
+                                               rounding=val.rounding,
+                                               min_max=val.min_max,
+                                               helptext=self._config.helptext(section, key))
                 self.tk_vars.setdefault(section, dict())[key] = cp_option.tk_var
                 config_dicts.setdefault(section, dict())[key] = cp_option
         logger.debug("Formatted Config for GUI: %s", config_dicts)